@@ -44,6 +44,7 @@ DEFAULT_CONFIG = {
     "CHAT_CACHE_PATH": os.getenv("CHAT_CACHE_PATH", str(CHAT_CACHE_PATH)),
     "CACHE_PATH": os.getenv("CACHE_PATH", str(CACHE_PATH)),
     "CHAT_CACHE_LENGTH": int(os.getenv("CHAT_CACHE_LENGTH", "100")),
+    "CHAT_CACHE_MAX_CHARS": int(os.getenv("CHAT_CACHE_MAX_CHARS", "0")),
     "CACHE_LENGTH": int(os.getenv("CACHE_LENGTH", "100")),
     "ENABLE_CACHE": os.getenv("ENABLE_CACHE", "true"),
 
@@ -1,11 +1,22 @@
 import json
+import os
+import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from json.encoder import encode_basestring
 from pathlib import Path
-from typing import Any, Dict, List
+from types import ModuleType
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from .base_handler import BaseHandler
 from ..persona import Persona
@@ -14,7 +25,369 @@ from ..llm import get_global_client  # <-- Import the new client getter
 
 console = Console()
 
-# ... (ChatSession class remains unchanged) ...
+# Canonical role strings; roles read from disk are interned to these
+ROLE_SYSTEM = sys.intern("system")
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+
+
+_RECORD_KEYS = frozenset(("role", "content", "timestamp"))
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize a message to a single UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data) + b"\n"
+
+    # Without orjson, encode the fixed session record shape directly,
+    # which skips the generic encoder's type dispatch
+    if data.keys() == _RECORD_KEYS and type(data["timestamp"]) is int:
+        return (
+            '{"role":' + encode_basestring(data["role"])
+            + ',"content":' + encode_basestring(data["content"])
+            + ',"timestamp":' + str(data["timestamp"]) + '}\n'
+        ).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a message from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=128)
+def _read_session(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[Dict[str, Any], ...], int]:
+    """
+    Read and parse all messages of a session file.
+
+    Results are cached per (path, mtime_ns, size), so any write to the
+    file invalidates the cached entry. Roles are interned so that role
+    checks compare canonical strings. A trailing line without a newline is
+    the remnant of an interrupted append and is skipped, as are lines that
+    fail to decode and records without a string role or content.
+
+    Returns:
+        Tuple of (records, number of skipped complete lines)
+    """
+    records = []
+    skipped = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n") or not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except ValueError:
+                # Covers JSON syntax errors and invalid UTF-8
+                skipped += 1
+                continue
+            if not (
+                isinstance(record, dict)
+                and isinstance(record.get("role"), str)
+                and isinstance(record.get("content"), str)
+            ):
+                skipped += 1
+                continue
+            record["role"] = sys.intern(record["role"])
+            records.append(record)
+    return tuple(records), skipped
+
+
+@lru_cache(maxsize=128)
+def _count_messages(path: str, mtime_ns: int, size: int) -> int:
+    """
+    Count the messages of a session file without decoding them.
+
+    Every message is written as one line and JSON escapes newlines inside
+    strings, so counting newline bytes in raw blocks is enough.
+    """
+    count = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            count += block.count(b"\n")
+    return count
+
+
+def _session_row(entry: os.DirEntry) -> Tuple[str, str, str]:
+    """Build the (session ID, message count, last modified) row for a session file."""
+    stat = entry.stat()
+    try:
+        message_count = str(_count_messages(entry.path, stat.st_mtime_ns, stat.st_size))
+    except IOError:
+        message_count = "?"
+
+    modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(stat.st_mtime))
+    return entry.name[:-len(".jsonl")], message_count, modified
+
+
+def _timestamp_ns(record: Dict[str, Any]) -> int:
+    """Get a record's timestamp in nanoseconds, converting float seconds."""
+    timestamp = record.get("timestamp", 0)
+    if isinstance(timestamp, float):
+        return int(timestamp * 1_000_000_000)
+    return timestamp
+
+
+def _stat_key(session_file: Path) -> Tuple[str, int, int]:
+    """Build the cache key for a session file."""
+    stat = session_file.stat()
+    return str(session_file), stat.st_mtime_ns, stat.st_size
+
+
+class ChatSession:
+    """
+    Persistent chat session backed by a JSON Lines file.
+
+    Stores the conversation history for a session ID in the chat cache
+    directory, one message per line. New messages are appended; the file
+    is only rewritten when truncation drops old messages.
+
+    Messages are kept in structure-of-arrays form: the history deque holds
+    the role/content dictionaries sent to the API as-is, and timestamps
+    live in a parallel deque. The system message is pinned outside the
+    bounded history, so evicting old turns never drops it.
+
+    History is bounded both by message count and, optionally, by the
+    total number of content characters.
+    """
+
+    def __init__(self, session_id: str, max_length: int = 100, max_chars: int = 0) -> None:
+        """
+        Initialize chat session.
+
+        Args:
+            session_id: Session identifier ('temp' for a non-persistent session)
+            max_length: Maximum number of messages to keep
+            max_chars: Maximum total content characters of non-system
+                messages to keep (0 disables the limit)
+        """
+        self.session_id = session_id
+        self.max_length = max_length
+        try:
+            # Values from the config file may arrive as strings
+            self.max_chars = int(max_chars or 0)
+        except (TypeError, ValueError):
+            console.print(
+                f"[yellow]Warning: Invalid CHAT_CACHE_MAX_CHARS value {max_chars!r}, disabling the limit[/yellow]"
+            )
+            self.max_chars = 0
+        self.is_temp = session_id == "temp"
+
+        self.cache_dir = Path(config.get("CHAT_CACHE_PATH"))
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.session_file = self.cache_dir / f"{session_id}.jsonl"
+
+        self._system_msg: Optional[Dict[str, str]] = None
+        self._system_timestamp = 0
+        self.messages: Deque[Dict[str, str]] = deque(maxlen=max_length)
+        # Wall-clock timestamps in integer nanoseconds
+        self._timestamps: Deque[int] = deque(maxlen=max_length)
+        self._total_chars = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._needs_rewrite = False
+        self._load_messages()
+
+    def _load_messages(self) -> None:
+        """Load session messages from disk."""
+        if self.is_temp or not self.session_file.exists():
+            return
+
+        try:
+            path, mtime_ns, size = _stat_key(self.session_file)
+            records, skipped = _read_session(path, mtime_ns, size)
+            if size:
+                with open(path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    # Rewrite instead of appending after an interrupted write
+                    self._needs_rewrite = f.read(1) != b"\n"
+        except IOError as e:
+            console.print(f"[yellow]Warning: Could not load chat session '{self.session_id}': {e}[/yellow]")
+            return
+
+        if skipped:
+            console.print(
+                f"[yellow]Warning: Skipped {skipped} unreadable line(s) "
+                f"in chat session '{self.session_id}'[/yellow]"
+            )
+            # Drop the unreadable lines on the next write
+            self._needs_rewrite = True
+
+        if records and records[0]["role"] == ROLE_SYSTEM:
+            self._system_msg = {"role": ROLE_SYSTEM, "content": records[0]["content"]}
+            self._system_timestamp = _timestamp_ns(records[0])
+            records = records[1:]
+
+        maxlen = self._history_length()
+        self.messages = deque(
+            ({"role": record["role"], "content": record["content"]} for record in records),
+            maxlen=maxlen
+        )
+        self._timestamps = deque((_timestamp_ns(record) for record in records), maxlen=maxlen)
+        self._total_chars = sum(len(message["content"]) for message in self.messages)
+        self._enforce_char_budget()
+
+    def _history_length(self) -> int:
+        """Get the number of non-system messages to keep."""
+        if self._system_msg is not None:
+            return max(self.max_length - 1, 1)
+        return self.max_length
+
+    def _enforce_char_budget(self) -> bool:
+        """
+        Drop the oldest messages until the history fits the character budget.
+
+        The most recent message is always kept.
+
+        Returns:
+            True if any messages were dropped
+        """
+        if not self.max_chars:
+            return False
+
+        dropped = False
+        while self._total_chars > self.max_chars and len(self.messages) > 1:
+            self._total_chars -= len(self.messages.popleft()["content"])
+            self._timestamps.popleft()
+            dropped = True
+        return dropped
+
+    def _all_messages(self) -> List[Dict[str, str]]:
+        """Get all stored messages, system message first."""
+        if self._system_msg is not None:
+            return [self._system_msg, *self.messages]
+        return list(self.messages)
+
+    def _records(self) -> List[Dict[str, Any]]:
+        """Get all stored messages in their on-disk form."""
+        records = [
+            {"role": message["role"], "content": message["content"], "timestamp": timestamp}
+            for message, timestamp in zip(self.messages, self._timestamps)
+        ]
+        if self._system_msg is not None:
+            records.insert(0, {
+                "role": ROLE_SYSTEM,
+                "content": self._system_msg["content"],
+                "timestamp": self._system_timestamp,
+            })
+        return records
+
+    def _append_messages(self, records: List[Dict[str, Any]]) -> None:
+        """Append messages to the session file in a single write."""
+        if self.is_temp:
+            return
+
+        try:
+            with open(self.session_file, "ab") as f:
+                f.write(b"".join(_dumps(record) for record in records))
+        except IOError as e:
+            console.print(f"[yellow]Warning: Could not save chat session '{self.session_id}': {e}[/yellow]")
+
+    def _rewrite_all(self) -> None:
+        """Atomically rewrite the session file from the in-memory messages."""
+        if self.is_temp:
+            return
+
+        tmp_file = self.session_file.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(b"".join(_dumps(record) for record in self._records()))
+            os.replace(tmp_file, self.session_file)
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not save chat session '{self.session_id}': {e}[/yellow]")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+    def add_message(self, role: str, content: str, persist: bool = True) -> None:
+        """
+        Add a message to the session.
+
+        Args:
+            role: Message role (system, user, assistant)
+            content: Message content
+            persist: Whether to write pending messages to disk now;
+                when False, they are written by the next flush()
+        """
+        role = sys.intern(role)
+        message = {"role": role, "content": content}
+        timestamp = time.time_ns()
+
+        if role == ROLE_SYSTEM:
+            # The system message always leads the file
+            if self._system_msg is not None or self.messages:
+                self._needs_rewrite = True
+            self._system_msg = message
+            self._system_timestamp = timestamp
+            maxlen = self._history_length()
+            self.messages = deque(self.messages, maxlen=maxlen)
+            self._timestamps = deque(self._timestamps, maxlen=maxlen)
+            # A full history loses its oldest message to the shorter maxlen
+            self._total_chars = sum(len(message["content"]) for message in self.messages)
+        else:
+            if len(self.messages) == self.messages.maxlen:
+                # Appending evicts the oldest message
+                self._total_chars -= len(self.messages[0]["content"])
+                self._needs_rewrite = True
+            self.messages.append(message)
+            self._timestamps.append(timestamp)
+            self._total_chars += len(content)
+            if self._enforce_char_budget():
+                self._needs_rewrite = True
+
+        if not self._needs_rewrite:
+            self._pending.append({"role": role, "content": content, "timestamp": timestamp})
+
+        if persist:
+            self.flush()
+
+    def ensure_system(self, content: str) -> None:
+        """
+        Add the system message unless the session already has one.
+
+        Args:
+            content: System prompt content
+        """
+        if self._system_msg is None:
+            self.add_message(ROLE_SYSTEM, content)
+
+    def flush(self) -> None:
+        """Write pending messages to disk."""
+        if self._needs_rewrite:
+            self._rewrite_all()
+        elif self._pending:
+            self._append_messages(self._pending)
+
+        self._pending = []
+        self._needs_rewrite = False
+
+    def get_messages(self) -> List[Dict[str, str]]:
+        """
+        Get messages in the format expected by the API.
+
+        Returns:
+            List of role/content message dictionaries
+        """
+        # The stored messages are already API-shaped; the returned list is
+        # fresh, so callers may extend it (e.g. with tool calls)
+        return self._all_messages()
+
+    def clear(self) -> None:
+        """Clear session history and remove the session file."""
+        self._system_msg = None
+        self.messages = deque(maxlen=self.max_length)
+        self._timestamps = deque(maxlen=self.max_length)
+        self._total_chars = 0
+        self._pending = []
+        self._needs_rewrite = False
+        if self.session_file.exists():
+            try:
+                self.session_file.unlink()
+            except OSError as e:
+                console.print(f"[yellow]Warning: Could not delete chat session file: {e}[/yellow]")
+
 
 class ChatHandler(BaseHandler):
     """
@@ -29,16 +402,16 @@ class ChatHandler(BaseHandler):
 
         self.session = ChatSession(
             session_id=session_id,
-            max_length=config.get("CHAT_CACHE_LENGTH")
+            max_length=config.get("CHAT_CACHE_LENGTH"),
+            max_chars=config.get("CHAT_CACHE_MAX_CHARS", 0)
         )
 
-        # Add system message if this is a new session
-        if not self.session.messages:
-            self.session.add_message("system", self.persona.system_prompt)
+        # Add system message if the session does not have one yet
+        self.session.ensure_system(self.persona.system_prompt)
 
     def make_messages(self, prompt: str) -> List[Dict[str, str]]:
-        # Add user message to session
-        self.session.add_message("user", prompt)
+        # Add user message to session; it is persisted with the reply
+        self.session.add_message(ROLE_USER, prompt, persist=False)
         # Return all messages for API call
         return self.session.get_messages()
 
@@ -73,7 +446,7 @@ class ChatHandler(BaseHandler):
                 full_response = self.stream_response(response_generator)
 
                 # Add assistant response to session
-                self.session.add_message("assistant", full_response)
+                self.session.add_message(ROLE_ASSISTANT, full_response, persist=False)
 
             else:
                 # Non-streaming response
@@ -98,7 +471,7 @@ class ChatHandler(BaseHandler):
                 self.print_response(content)
 
                 # Add assistant response to session
-                self.session.add_message("assistant", content)
+                self.session.add_message(ROLE_ASSISTANT, content, persist=False)
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Operation cancelled by user[/yellow]")
@@ -106,4 +479,96 @@ class ChatHandler(BaseHandler):
         except Exception as e:
             self.handle_error(e)
 
-    # ... (list_sessions, show_session, delete_session remain unchanged) ...
+        finally:
+            # Write the whole turn to disk at once
+            self.session.flush()
+
+    @staticmethod
+    def list_sessions() -> None:
+        """Display all saved chat sessions."""
+        from rich.table import Table
+
+        cache_dir = config.get("CHAT_CACHE_PATH")
+        try:
+            # DirEntry caches its stat result, so each file is stat'ed once
+            with os.scandir(cache_dir) as it:
+                entries = [e for e in it if e.name.endswith(".jsonl") and e.is_file()]
+        except OSError:
+            entries = []
+
+        if not entries:
+            console.print("[yellow]No chat sessions found[/yellow]")
+            return
+
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+
+        table = Table(title="Chat Sessions", show_header=True, header_style="bold cyan")
+        table.add_column("Session ID", style="green")
+        table.add_column("Messages", justify="right")
+        table.add_column("Last Modified", style="dim")
+
+        # Reading files is I/O-bound, so count them in parallel and only
+        # touch the (non thread-safe) table from this thread
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            rows = list(executor.map(_session_row, entries))
+
+        for row in rows:
+            table.add_row(*row)
+
+        console.print(table)
+
+    @staticmethod
+    def show_session(session_id: str) -> None:
+        """
+        Display the message history of a chat session.
+
+        Args:
+            session_id: Session identifier
+        """
+        from rich.panel import Panel
+
+        session_file = Path(config.get("CHAT_CACHE_PATH")) / f"{session_id}.jsonl"
+
+        if not session_file.exists():
+            console.print(f"[red]Error: Chat session '{session_id}' not found[/red]")
+            return
+
+        # Share the loading path (and its parse cache) with chat sessions
+        session = ChatSession(
+            session_id,
+            max_length=config.get("CHAT_CACHE_LENGTH"),
+            max_chars=config.get("CHAT_CACHE_MAX_CHARS", 0)
+        )
+
+        for message in session.messages:
+            role = message["role"]
+            if role == ROLE_SYSTEM:
+                continue
+
+            border_style = "green" if role == ROLE_USER else "cyan"
+            panel = Panel(
+                message["content"],
+                title=role.capitalize(),
+                border_style=border_style
+            )
+            console.print(panel)
+
+    @staticmethod
+    def delete_session(session_id: str) -> None:
+        """
+        Delete a saved chat session.
+
+        Args:
+            session_id: Session identifier
+        """
+        session_file = Path(config.get("CHAT_CACHE_PATH")) / f"{session_id}.jsonl"
+
+        if not session_file.exists():
+            console.print(f"[red]Error: Chat session '{session_id}' not found[/red]")
+            return
+
+        try:
+            session_file.unlink()
+            console.print(f"[green]✓ Chat session '{session_id}' deleted[/green]")
+        except OSError as e:
+            console.print(f"[red]Error deleting chat session '{session_id}': {e}[/red]")
@@ -156,8 +156,10 @@ class DefaultHandler(BaseHandler):
         # Extract potential shell command (simple heuristic)
         command = response.strip()
 
-        # Skip if response doesn't look like a shell command
-        if not command or "\n" in command or len(command) > 200:
+        # Skip if response doesn't look like a shell command; the O(1)
+        # length checks run before the newline scan
+        length = len(command)
+        if not length or length > 200 or "\n" in command:
             return
 
         from ..utils import run_shell_command
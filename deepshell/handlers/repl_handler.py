@@ -13,10 +13,9 @@ from prompt_toolkit import PromptSession
 from prompt_toolkit.history import InMemoryHistory
 from prompt_toolkit.key_binding import KeyBindings
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
-from .chat_handler import ChatHandler
+from .chat_handler import ROLE_ASSISTANT, ROLE_SYSTEM, ROLE_USER, ChatHandler
 from ..persona import Persona
 from ..utils import run_shell_command
 
@@ -122,6 +121,8 @@ class ReplHandler(ChatHandler):
     
     def _show_welcome(self) -> None:
         """Display REPL welcome message."""
+        from rich.panel import Panel
+
         welcome_text = f"""[bold cyan]DeepShell REPL[/bold cyan]
 Session: {self.session.session_id}
 Persona: {self.persona.name}
@@ -193,7 +194,7 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
         elif command == "clear":
             self.session.clear()
             # Re-add system message
-            self.session.add_message("system", self.persona.system_prompt)
+            self.session.add_message(ROLE_SYSTEM, self.persona.system_prompt)
             console.print("[green]✓ Session history cleared[/green]")
             return True
         
@@ -233,6 +234,8 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
     
     def _show_help(self) -> None:
         """Show REPL help information."""
+        from rich.panel import Panel
+
         help_text = """[bold]DeepShell REPL Commands[/bold]
 
 [cyan]General Commands:[/cyan]
@@ -287,7 +290,7 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
                 full_response = self.stream_response(response_generator)
                 
                 # Add assistant response to session
-                self.session.add_message("assistant", full_response)
+                self.session.add_message(ROLE_ASSISTANT, full_response, persist=False)
                 
                 # Store shell command if applicable
                 if self.persona.name == "shell":
@@ -304,7 +307,7 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
                 self.print_response(content)
                 
                 # Add assistant response to session
-                self.session.add_message("assistant", content)
+                self.session.add_message(ROLE_ASSISTANT, content, persist=False)
                 
                 # Store shell command if applicable
                 if self.persona.name == "shell":
@@ -312,6 +315,10 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
         
         except Exception as e:
             self.handle_error(e)
+        
+        finally:
+            # Write the whole turn to disk at once
+            self.session.flush()
     
     def make_messages(self, prompt: str) -> List[Dict[str, str]]:
         """
@@ -323,8 +330,8 @@ Press Ctrl+D to exit, Ctrl+C to cancel input[/dim]
         Returns:
             List of messages including history and new prompt
         """
-        # Add user message to session
-        self.session.add_message("user", prompt)
+        # Add user message to session; it is persisted with the reply
+        self.session.add_message(ROLE_USER, prompt, persist=False)
         
         # Return all messages for API call
         return self.session.get_messages()
@@ -4,24 +4,86 @@ OpenAI LLM client integration using LiteLLM.
 This module provides a unified interface for interacting with OpenAI language models.
 """
 
+import asyncio
+import atexit
+import copy
+import hashlib
+import importlib.util
 import json
-import os
+import logging
+import random
+import threading
 import time
-from typing import Any, Dict, Generator, List, Optional, Union
+import weakref
+from collections import OrderedDict
+from types import ModuleType
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+import httpx
 import litellm
-from litellm import completion
+from litellm import acompletion, completion
 from rich.console import Console
 
 from .config import config
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 # Configure LiteLLM
 litellm.suppress_debug_info = True
 litellm.drop_params = True  # Drop unsupported parameters
 
+DEFAULT_API_BASE = "https://api.openai.com/v1"
+
+# Created on first use so importing the module doesn't probe the terminal
+_console: Optional[Console] = None
+
+
+def _get_console() -> Console:
+    """Get the console used for retry and error notices."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+# Shared keep-alive connection pool for direct API calls
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+# Sentinel returned by the SSE parser at the end of a stream
+_SSE_DONE = object()
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Get the connection pool settings shared by the sync and async clients."""
+    return {
+        # HTTP/2 needs the optional 'h2' package
+        "http2": importlib.util.find_spec("h2") is not None,
+        "limits": httpx.Limits(
+            max_keepalive_connections=20,
+            max_connections=100,
+            keepalive_expiry=30,
+        ),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """Get or create the pooled HTTP client used for direct API calls."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(**_http_client_options())
+            atexit.register(_http_client.close)
+    return _http_client
+
 
 class MockResponse:
     """Mock response object for error handling."""
@@ -39,14 +101,54 @@ class MockMessage:
         self.content = content
 
 
-class BaseLLMClient(ABC):
-    """Base class for all LLM clients."""
+class _LLMClientCore(ABC):
+    """Configuration, caching and retry bookkeeping shared by sync and async clients."""
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 60, max_retries: int = 3):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 60,
+        max_retries: int = 3,
+        cache_size: int = 512,
+        cache_ttl: float = 3600.0,
+        max_delay: float = 30.0,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 10.0,
+        stream_batch: int = 8,
+        stream_interval: float = 0.02,
+    ):
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = 1.0
+        self.max_delay = max_delay
+        # Per-client RNG so concurrent clients don't share a jitter sequence
+        self._rng = random.Random()
+
+        # Circuit breaker: after breaker_threshold consecutive failed calls,
+        # fail fast for breaker_cooldown seconds instead of retrying
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+
+        # Streamed chunks are coalesced up to stream_batch chunks or
+        # stream_interval seconds, whichever comes first. Batches are only
+        # checked as chunks arrive, so in the worst case a chunk that lands
+        # within stream_interval of a flush waits for the next chunk or the
+        # end of the stream
+        self.stream_batch = stream_batch
+        self.stream_interval = stream_interval
+
+        # Direct OpenAI-compatible transport, used when LiteLLM is disabled
+        self.api_base = DEFAULT_API_BASE
+        self.use_litellm = True
+
+        # In-process LRU cache of deterministic non-streaming responses
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._response_cache: "OrderedDict[bytes, Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @abstractmethod
     def get_model_prefix(self) -> str:
@@ -67,43 +169,162 @@ class BaseLLMClient(ABC):
     def _create_error_response(self, error_message: str) -> Any:
         return MockResponse(f"❌ Error: {error_message}")
 
-    def _retry_with_backoff(self, func, *args, **kwargs) -> Any:
-        last_exception = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                result = func(*args, **kwargs)
-                if result is None:
-                    raise ValueError("API returned None response")
-                if isinstance(result, bool):
-                    raise ValueError(f"API returned boolean: {result}")
-                if not kwargs.get('stream', False):
-                    if not hasattr(result, 'choices'):
-                        raise ValueError("API response missing 'choices' attribute")
-                    if not result.choices:
-                        raise ValueError("API response has empty choices")
-                return result
-            except Exception as e:
-                last_exception = e
-                console.print(f"DEBUG: Exception in attempt {attempt + 1}: {str(e)}")
-                if attempt == self.max_retries:
-                    break
-                delay = self.retry_delay * (2 ** attempt)
-                console.print(f"[yellow]Retry {attempt + 1}/{self.max_retries} in {delay:.1f}s...[/yellow]")
-                time.sleep(delay)
-        console.print(f"DEBUG: All retries failed, raising: {str(last_exception)}")
-        return self._create_error_response(str(last_exception))
+    @staticmethod
+    def _parse_sse_line(line: str) -> Any:
+        """Parse one server-sent event line into its JSON payload.
+
+        Returns:
+            The decoded payload, _SSE_DONE at the end of the stream, or None
+            for lines that carry no data.
+        """
+        if not line.startswith("data:"):
+            return None
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            return _SSE_DONE
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+    @staticmethod
+    def _event_text(event: Dict[str, Any]) -> Optional[str]:
+        """Extract the text to show for a decoded streaming event."""
+        choices = event.get("choices")
+        if not choices:
+            return None
+        delta = choices[0].get("delta") or {}
+        content = delta.get("content")
+        if content:
+            return content
+        notices = []
+        for tool_call in delta.get("tool_calls") or ():
+            name = (tool_call.get("function") or {}).get("name")
+            if name:
+                notices.append(f"\n🔧 Calling function: {name}\n")
+        return "".join(notices) or None
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> Optional[str]:
+        """Extract the text to show for a LiteLLM streaming chunk."""
+        # One getattr per attribute instead of hasattr + access
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return None
+        delta = choices[0].delta
+        content = getattr(delta, "content", None)
+        if content:
+            return content
+        notices = []
+        for tool_call in getattr(delta, "tool_calls", None) or ():
+            name = tool_call.function.name
+            if name:
+                notices.append(f"\n🔧 Calling function: {name}\n")
+        return "".join(notices) or None
+
+    def _cache_key(self, completion_kwargs: Dict[str, Any]) -> bytes:
+        """Hash the request fields that determine a completion."""
+        # Surrounding whitespace is ignored when matching, so e.g. piped
+        # input with a trailing newline shares entries; the request itself
+        # is sent unchanged
+        messages = [
+            {**message, "content": message["content"].strip()}
+            if isinstance(message.get("content"), str) else message
+            for message in completion_kwargs["messages"]
+        ]
+        key_data = {
+            "model": completion_kwargs["model"],
+            "messages": messages,
+            "temperature": completion_kwargs["temperature"],
+            "top_p": completion_kwargs["top_p"],
+            "max_tokens": completion_kwargs.get("max_tokens"),
+            "tools": completion_kwargs.get("tools"),
+        }
+        if orjson is not None:
+            key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            key_bytes = json.dumps(
+                key_data, sort_keys=True, separators=(",", ":"), default=str
+            ).encode("utf-8")
+        return hashlib.blake2b(key_bytes, digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[Any]:
+        """Get a copy of a cached response if present and not expired."""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            stored_at, response = entry
+            if time.monotonic() - stored_at > self.cache_ttl:
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+        # Each caller gets its own copy, so mutating it can't leak into later hits
+        return copy.deepcopy(response)
+
+    def _cache_set(self, key: bytes, response: Any) -> None:
+        """Store a copy of a response, evicting the least recently used entries."""
+        response = copy.deepcopy(response)
+        with self._cache_lock:
+            self._response_cache[key] = (time.monotonic(), response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+
+    @staticmethod
+    def _counts_as_upstream_failure(error: Exception) -> bool:
+        """Check if an error indicates upstream trouble rather than a bad request."""
+        status_code = getattr(error, "status_code", None)
+        if not isinstance(status_code, int):
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        if not isinstance(status_code, int):
+            # Timeouts, connection errors, malformed responses
+            return True
+        return status_code == 429 or status_code >= 500
+
+    def _breaker_error(self) -> Optional[Any]:
+        """Get an error response if the circuit breaker is open."""
+        if time.monotonic() < self._breaker_open_until:
+            return self._create_error_response(
+                "Circuit open after repeated API failures, try again shortly"
+            )
+        return None
 
-    def complete(
+    @staticmethod
+    def _check_result(result: Any, stream: bool) -> None:
+        """Raise if an API call returned something unusable."""
+        if stream:
+            if result is None or isinstance(result, bool):
+                raise ValueError(f"API returned {result!r} instead of a stream")
+        # A single lookup covers None, booleans, missing and empty choices
+        elif not getattr(result, "choices", None):
+            raise ValueError("API response has no choices")
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Get the backoff before the next attempt, printing a retry notice."""
+        # Exponential backoff with full jitter
+        delay = self._rng.uniform(0, min(self.retry_delay * (2 ** attempt), self.max_delay))
+        _get_console().print(f"[yellow]Retry {attempt + 1}/{self.max_retries} in {delay:.1f}s...[/yellow]")
+        return delay
+
+    def _record_failure(self, error: Exception) -> Any:
+        """Update the circuit breaker after a failed call and build its error response."""
+        logger.debug("All retries failed: %s", error)
+        if self._counts_as_upstream_failure(error):
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.breaker_threshold:
+                self._breaker_open_until = time.monotonic() + self.breaker_cooldown
+        return self._create_error_response(str(error))
+
+    def _build_completion_kwargs(
         self,
         messages: List[Dict[str, str]],
-        model: Optional[str] = None,
-        temperature: float = 0.0,
-        top_p: float = 1.0,
-        max_tokens: Optional[int] = None,
-        stream: bool = False,
-        functions: Optional[List[Dict[str, Any]]] = None,
-        **kwargs
-    ) -> Union[Any, Generator[str, None, None]]:
+        model: Optional[str],
+        temperature: float,
+        top_p: float,
+        max_tokens: Optional[int],
+        stream: bool,
+        functions: Optional[List[Dict[str, Any]]],
+        extra: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the keyword arguments for a completion request."""
         model_name = model or self.get_default_model()
         valid_keys = {
             "model", "messages", "temperature", "top_p", "stream", "timeout", "max_tokens", "tools", "tool_choice"
@@ -116,6 +337,9 @@ class BaseLLMClient(ABC):
             "stream": stream,
             "timeout": self.timeout,
         }
+        if self.use_litellm and self.api_key:
+            # Passed per call so clients with different keys can coexist
+            completion_kwargs["api_key"] = self.api_key
         if max_tokens is not None:
             completion_kwargs["max_tokens"] = max_tokens
         if functions:
@@ -123,59 +347,204 @@ class BaseLLMClient(ABC):
                 {"type": "function", "function": func} for func in functions
             ]
             completion_kwargs["tool_choice"] = "auto"
-        for k, v in kwargs.items():
+        for k, v in extra.items():
             if k in valid_keys:
                 completion_kwargs[k] = v
+        return completion_kwargs
+
+    def _cacheable(self, completion_kwargs: Dict[str, Any], use_cache: bool) -> bool:
+        """Check if a request may be served from the response cache."""
+        if not use_cache or self.cache_size <= 0:
+            return False
+        if str(config.get("ENABLE_CACHE", "true")).lower() == "false":
+            return False
+        # Only deterministic requests are served from the cache
+        return completion_kwargs["temperature"] <= 0
+
+    @staticmethod
+    def _chat_messages(prompt: str, system_message: Optional[str]) -> List[Dict[str, str]]:
+        """Build the message list for a single-turn chat."""
+        messages = []
+        if system_message:
+            messages.append({"role": "system", "content": system_message})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _validate_chat_response(self, response: Any) -> Any:
+        """Return the response, or an error response if it has no message."""
+        # complete() only returns responses with non-empty choices
+        if not hasattr(getattr(response.choices[0], "message", None), "content"):
+            return self._create_error_response("Invalid message structure in API response")
+        return response
+
+    @staticmethod
+    def _has_content(response: Any) -> bool:
+        """Check if a response carries non-empty message content."""
+        if not response or not hasattr(response, 'choices') or not response.choices:
+            return False
+        if not hasattr(response.choices[0], 'message') or not response.choices[0].message:
+            return False
+        return bool(response.choices[0].message.content)
+
+
+class BaseLLMClient(_LLMClientCore):
+    """Base class for all LLM clients."""
+
+    def _complete_direct(self, **kwargs) -> Any:
+        """Post a non-streaming chat completion over the pooled HTTP client."""
+        timeout = kwargs.pop("timeout", self.timeout)
+        response = get_http_client().post(
+            f"{self.api_base.rstrip('/')}/chat/completions",
+            json=kwargs,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return litellm.ModelResponse(**response.json())
+
+    def _open_direct_stream(self, **kwargs) -> httpx.Response:
+        """Open a streaming chat completion over the pooled HTTP client."""
+        timeout = kwargs.pop("timeout", self.timeout)
+        client = get_http_client()
+        request = client.build_request(
+            "POST",
+            f"{self.api_base.rstrip('/')}/chat/completions",
+            json=kwargs,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+        response = client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            response.close()
+            raise
+        return response
+
+    def _stream_direct(self, **kwargs) -> Generator[str, None, None]:
+        """Stream a chat completion by parsing the server-sent events directly."""
+        response = self._retry_with_backoff(self._open_direct_stream, **kwargs)
+        if isinstance(response, MockResponse):
+            yield response.choices[0].message.content
+            return
+
+        try:
+            for line in response.iter_lines():
+                event = self._parse_sse_line(line)
+                if event is _SSE_DONE:
+                    break
+                if event is None:
+                    continue
+                text = self._event_text(event)
+                if text:
+                    yield text
+        finally:
+            response.close()
+
+    def _retry_with_backoff(self, func, *args, **kwargs) -> Any:
+        breaker_error = self._breaker_error()
+        if breaker_error is not None:
+            return breaker_error
+
+        last_exception: Exception = RuntimeError("No attempts made")
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = func(*args, **kwargs)
+                self._check_result(result, kwargs.get('stream', False))
+                self._consecutive_failures = 0
+                return result
+            except Exception as e:
+                last_exception = e
+                logger.debug("Attempt %d failed: %s", attempt + 1, e)
+                if attempt == self.max_retries:
+                    break
+                time.sleep(self._retry_delay(attempt))
+        return self._record_failure(last_exception)
+
+    def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        functions: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Union[Any, Generator[str, None, None]]:
+        use_cache = kwargs.pop("cache", True)
+        completion_kwargs = self._build_completion_kwargs(
+            messages, model, temperature, top_p, max_tokens, stream, functions, kwargs
+        )
         if stream:
-            return self._stream_completion(**completion_kwargs)
-        else:
-            return self._retry_with_backoff(completion, **completion_kwargs)
+            return self._batch_chunks(self._stream_completion(**completion_kwargs))
+
+        send = completion if self.use_litellm else self._complete_direct
+        if not self._cacheable(completion_kwargs, use_cache):
+            return self._retry_with_backoff(send, **completion_kwargs)
+
+        cache_key = self._cache_key(completion_kwargs)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self._retry_with_backoff(send, **completion_kwargs)
+        if not isinstance(response, MockResponse):
+            self._cache_set(cache_key, response)
+        return response
 
     def _stream_completion(self, **kwargs) -> Generator[str, None, None]:
         try:
+            if not self.use_litellm:
+                yield from self._stream_direct(**kwargs)
+                return
             stream = self._retry_with_backoff(completion, **kwargs)
+            if isinstance(stream, MockResponse):
+                yield stream.choices[0].message.content
+                return
             if not hasattr(stream, '__iter__'):
                 yield f"❌ Streaming Error: {getattr(stream, 'content', str(stream))}"
                 return
             for chunk in stream:
-                if hasattr(chunk, 'choices') and chunk.choices:
-                    delta = chunk.choices[0].delta
-                    if hasattr(delta, 'content') and delta.content:
-                        yield delta.content
-                    elif hasattr(delta, 'tool_calls') and delta.tool_calls:
-                        for tool_call in delta.tool_calls:
-                            if tool_call.function.name:
-                                yield f"\n🔧 Calling function: {tool_call.function.name}\n"
+                text = self._chunk_text(chunk)
+                if text:
+                    yield text
         except Exception as e:
-            console.print(f"[red]Streaming error: {str(e)}[/red]")
+            _get_console().print(f"[red]Streaming error: {str(e)}[/red]")
             yield f"❌ Streaming Error: {str(e)}"
 
+    def _batch_chunks(self, chunks: Generator[str, None, None]) -> Generator[str, None, None]:
+        """Coalesce streamed chunks to cut per-chunk work in the consumer."""
+        if self.stream_batch <= 1:
+            yield from chunks
+            return
+
+        buffer: List[str] = []
+        last_flush = 0.0  # The first chunk is flushed right away
+        for chunk in chunks:
+            buffer.append(chunk)
+            now = time.monotonic()
+            if len(buffer) >= self.stream_batch or now - last_flush >= self.stream_interval:
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = now
+        if buffer:
+            yield "".join(buffer)
+
     def chat(
         self,
         prompt: str,
         system_message: Optional[str] = None,
         **kwargs
     ) -> Union[str, Generator[str, None, None]]:
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
+        messages = self._chat_messages(prompt, system_message)
         try:
             response = self.complete(messages, **kwargs)
             if kwargs.get("stream", False):
                 return response
-            else:
-                if not response or not hasattr(response, 'choices'):
-                    return self._create_error_response("Invalid API response structure")
-                if not response.choices:
-                    return self._create_error_response("Empty choices in API response")
-                if not hasattr(response.choices[0], 'message'):
-                    return self._create_error_response("Invalid message structure in API response")
-                if not hasattr(response.choices[0].message, 'content'):
-                    return self._create_error_response("No content in API response message")
-                return response
+            return self._validate_chat_response(response)
         except Exception as e:
-            console.print(f"[red]Chat error: {str(e)}[/red]")
+            _get_console().print(f"[red]Chat error: {str(e)}[/red]")
             return self._create_error_response(f"Chat failed: {str(e)}")
 
     def test_connection(self) -> bool:
@@ -184,24 +553,232 @@ class BaseLLMClient(ABC):
                 messages=[{"role": "user", "content": "Hello"}],
                 max_tokens=10
             )
-            if not response or not hasattr(response, 'choices') or not response.choices:
-                return False
-            if not hasattr(response.choices[0], 'message') or not response.choices[0].message:
-                return False
-            return bool(response.choices[0].message.content)
+            return self._has_content(response)
         except Exception as e:
-            console.print(f"[red]Connection test failed: {str(e)}[/red]")
+            _get_console().print(f"[red]Connection test failed: {str(e)}[/red]")
             return False
 
 
-class OpenAIClient(BaseLLMClient):
-    """OpenAI LLM client."""
+class AsyncBaseLLMClient(_LLMClientCore):
+    """Base class for LLM clients with awaitable completions.
+
+    Independent prompts can run concurrently, e.g.
+    ``await asyncio.gather(client.chat(p1), client.chat(p2))``. The HTTP
+    connection pool is bound to the event loop that first uses it; close it
+    with ``aclose()`` or use the client as an async context manager.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._async_http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """Get or create this client's pooled async HTTP client."""
+        if self._async_http_client is None:
+            self._async_http_client = httpx.AsyncClient(**_http_client_options())
+        return self._async_http_client
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client."""
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+            self._async_http_client = None
+
+    async def __aenter__(self) -> "AsyncBaseLLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _complete_direct(self, **kwargs) -> Any:
+        """Post a non-streaming chat completion over the pooled async HTTP client."""
+        timeout = kwargs.pop("timeout", self.timeout)
+        response = await self._get_async_http_client().post(
+            f"{self.api_base.rstrip('/')}/chat/completions",
+            json=kwargs,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        return litellm.ModelResponse(**response.json())
+
+    async def _open_direct_stream(self, **kwargs) -> httpx.Response:
+        """Open a streaming chat completion over the pooled async HTTP client."""
+        timeout = kwargs.pop("timeout", self.timeout)
+        client = self._get_async_http_client()
+        request = client.build_request(
+            "POST",
+            f"{self.api_base.rstrip('/')}/chat/completions",
+            json=kwargs,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=timeout,
+        )
+        response = await client.send(request, stream=True)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            await response.aclose()
+            raise
+        return response
+
+    async def _stream_direct(self, **kwargs) -> AsyncGenerator[str, None]:
+        """Stream a chat completion by parsing the server-sent events directly."""
+        response = await self._retry_with_backoff(self._open_direct_stream, **kwargs)
+        if isinstance(response, MockResponse):
+            yield response.choices[0].message.content
+            return
+
+        try:
+            async for line in response.aiter_lines():
+                event = self._parse_sse_line(line)
+                if event is _SSE_DONE:
+                    break
+                if event is None:
+                    continue
+                text = self._event_text(event)
+                if text:
+                    yield text
+        finally:
+            await response.aclose()
+
+    async def _retry_with_backoff(self, func, *args, **kwargs) -> Any:
+        breaker_error = self._breaker_error()
+        if breaker_error is not None:
+            return breaker_error
+
+        last_exception: Exception = RuntimeError("No attempts made")
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await func(*args, **kwargs)
+                self._check_result(result, kwargs.get('stream', False))
+                self._consecutive_failures = 0
+                return result
+            except Exception as e:
+                last_exception = e
+                logger.debug("Attempt %d failed: %s", attempt + 1, e)
+                if attempt == self.max_retries:
+                    break
+                await asyncio.sleep(self._retry_delay(attempt))
+        return self._record_failure(last_exception)
+
+    async def complete(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        functions: Optional[List[Dict[str, Any]]] = None,
+        **kwargs
+    ) -> Union[Any, AsyncGenerator[str, None]]:
+        use_cache = kwargs.pop("cache", True)
+        completion_kwargs = self._build_completion_kwargs(
+            messages, model, temperature, top_p, max_tokens, stream, functions, kwargs
+        )
+        if stream:
+            return self._batch_chunks(self._stream_completion(**completion_kwargs))
+
+        send = acompletion if self.use_litellm else self._complete_direct
+        if not self._cacheable(completion_kwargs, use_cache):
+            return await self._retry_with_backoff(send, **completion_kwargs)
+
+        cache_key = self._cache_key(completion_kwargs)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await self._retry_with_backoff(send, **completion_kwargs)
+        if not isinstance(response, MockResponse):
+            self._cache_set(cache_key, response)
+        return response
+
+    async def _stream_completion(self, **kwargs) -> AsyncGenerator[str, None]:
+        try:
+            if not self.use_litellm:
+                async for content in self._stream_direct(**kwargs):
+                    yield content
+                return
+            stream = await self._retry_with_backoff(acompletion, **kwargs)
+            if isinstance(stream, MockResponse):
+                yield stream.choices[0].message.content
+                return
+            if not hasattr(stream, '__aiter__'):
+                yield f"❌ Streaming Error: {getattr(stream, 'content', str(stream))}"
+                return
+            async for chunk in stream:
+                text = self._chunk_text(chunk)
+                if text:
+                    yield text
+        except Exception as e:
+            _get_console().print(f"[red]Streaming error: {str(e)}[/red]")
+            yield f"❌ Streaming Error: {str(e)}"
+
+    async def _batch_chunks(self, chunks: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+        """Coalesce streamed chunks to cut per-chunk work in the consumer."""
+        if self.stream_batch <= 1:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        buffer: List[str] = []
+        last_flush = 0.0  # The first chunk is flushed right away
+        async for chunk in chunks:
+            buffer.append(chunk)
+            now = time.monotonic()
+            if len(buffer) >= self.stream_batch or now - last_flush >= self.stream_interval:
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = now
+        if buffer:
+            yield "".join(buffer)
+
+    async def chat(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        **kwargs
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        messages = self._chat_messages(prompt, system_message)
+        try:
+            response = await self.complete(messages, **kwargs)
+            if kwargs.get("stream", False):
+                return response
+            return self._validate_chat_response(response)
+        except Exception as e:
+            _get_console().print(f"[red]Chat error: {str(e)}[/red]")
+            return self._create_error_response(f"Chat failed: {str(e)}")
+
+    async def test_connection(self) -> bool:
+        try:
+            response = await self.complete(
+                messages=[{"role": "user", "content": "Hello"}],
+                max_tokens=10
+            )
+            return self._has_content(response)
+        except Exception as e:
+            _get_console().print(f"[red]Connection test failed: {str(e)}[/red]")
+            return False
+
+
+_OPENAI_MODELS: Tuple[str, ...] = (
+    "gpt-3.5-turbo",
+    "gpt-4",
+    "gpt-4-turbo",
+    "gpt-4o",
+    "gpt-4o-mini",
+)
+_OPENAI_MODELS_SET = frozenset(_OPENAI_MODELS)
+
+
+class _OpenAIProvider(_LLMClientCore):
+    """OpenAI configuration and model list shared by the sync and async clients."""
 
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         super().__init__(api_key, **kwargs)
         self.api_key = api_key or config.get("OPENAI_API_KEY")
-        if self.api_key:
-            os.environ["OPENAI_API_KEY"] = self.api_key
+        self.api_base = config.get("API_BASE_URL") or DEFAULT_API_BASE
+        self.use_litellm = str(config.get("USE_LITELLM", "true")).lower() != "false"
         if not self.api_key:
             raise ValueError(
                 "OpenAI API key is required. Set OPENAI_API_KEY environment "
@@ -212,29 +789,40 @@ class OpenAIClient(BaseLLMClient):
         return "openai/"
 
     def get_available_models(self) -> List[str]:
-        return [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "gpt-4-turbo",
-            "gpt-4o",
-            "gpt-4o-mini"
-        ]
+        return list(_OPENAI_MODELS)
+
+    def validate_model(self, model: str) -> bool:
+        return model in _OPENAI_MODELS_SET
 
     def get_default_model(self) -> str:
         return "gpt-3.5-turbo"
 
 
+class OpenAIClient(_OpenAIProvider, BaseLLMClient):
+    """OpenAI LLM client."""
+
+
+class AsyncOpenAIClient(_OpenAIProvider, AsyncBaseLLMClient):
+    """OpenAI LLM client with awaitable completions."""
+
+
 # Provider registry (OpenAI only)
 PROVIDERS = {
     "openai": OpenAIClient,
 }
 
 
-def get_client(provider: Optional[str] = None) -> BaseLLMClient:
-    """Get LLM client for OpenAI."""
+def _resolve_provider(provider: Optional[str]) -> str:
+    """Resolve the provider name, rejecting anything but OpenAI."""
     provider_name = provider or config.get("PROVIDER", "openai")
     if provider_name != "openai":
         raise ValueError("Only 'openai' provider is supported in this version.")
+    return provider_name
+
+
+def get_client(provider: Optional[str] = None) -> BaseLLMClient:
+    """Get LLM client for OpenAI."""
+    provider_name = _resolve_provider(provider)
     client_class = PROVIDERS[provider_name]
     return client_class(
         timeout=config.get("REQUEST_TIMEOUT", 60),
@@ -255,22 +843,63 @@ def validate_provider(provider: str) -> bool:
 # Global client instance
 _client: Optional[BaseLLMClient] = None
 _current_provider: Optional[str] = None
+_client_lock = threading.Lock()
+
+# One async client per running event loop: its connection pool is bound
+# to the loop, and tasks on the same loop share it
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAIClient]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def get_global_client(provider: Optional[str] = None) -> BaseLLMClient:
     """Get or create global client instance."""
     global _client, _current_provider
-    provider_name = provider or config.get("PROVIDER", "openai")
-    if provider_name != "openai":
-        raise ValueError("Only 'openai' provider is supported in this version.")
-    if _client is None or _current_provider != provider_name:
-        _client = get_client(provider_name)
-        _current_provider = provider_name
-    return _client
+    provider_name = _resolve_provider(provider)
+    client = _client
+    if client is not None and _current_provider == provider_name:
+        return client
+    with _client_lock:
+        # Another thread may have created the client while we waited
+        if _client is None or _current_provider != provider_name:
+            _client = get_client(provider_name)
+            _current_provider = provider_name
+        return _client
+
+
+def get_async_client(provider: Optional[str] = None) -> AsyncOpenAIClient:
+    """Get or create the async client for the running event loop.
+
+    Must be called from a coroutine. Close the client with
+    close_async_client() before the loop shuts down.
+    """
+    _resolve_provider(provider)
+    loop = asyncio.get_running_loop()
+    with _client_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAIClient(
+                timeout=config.get("REQUEST_TIMEOUT", 60),
+                max_retries=config.get("MAX_RETRIES", 3),
+            )
+            _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running event loop's async client, if one was created."""
+    with _client_lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 def reset_client() -> None:
-    """Reset global client instance."""
+    """Reset global client instance.
+
+    Async clients are per event loop; reset those with close_async_client().
+    """
     global _client, _current_provider
-    _client = None
-    _current_provider = None
+    with _client_lock:
+        _client = None
+        _current_provider = None
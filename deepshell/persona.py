@@ -14,9 +14,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.table import Table
 
 from .config import config
 
@@ -413,6 +411,8 @@ def create_persona(name: str) -> None:
 
 def show_persona(name: str) -> None:
     """Display persona details."""
+    from rich.panel import Panel
+
     persona = get_persona_manager().load_persona(name)
     
     if persona is None:
@@ -439,6 +439,8 @@ def show_persona(name: str) -> None:
 
 def list_personas() -> None:
     """Display all available personas."""
+    from rich.table import Table
+
     manager = get_persona_manager()
     persona_names = manager.list_personas()
     
@@ -14,6 +14,7 @@ setup(
         "typer>=0.9.0",
         "rich>=13.0.0",
         "litellm>=1.0.0",
+        "httpx>=0.23.0",
         "python-dotenv>=0.19.0",
         "prompt-toolkit>=3.0.0",
         "pydantic>=2.0.0",
@@ -27,7 +28,10 @@ setup(
             "isort>=5.12.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
-        ]
+        ],
+        "speedups": [
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [